@@ -1,3 +1,27 @@
 from django.test import TestCase
+from django.contrib.auth.models import User
+from django.urls import reverse
+from .models import Post, Comment
 
 # Create your tests here.
+
+class MainPostViewTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [User.objects.create_user(username=f'user{i}', password='pass123') for i in range(3)]
+        profiles = [user.profile for user in cls.users]
+        for author in profiles:
+            for i in range(3):
+                post = Post.objects.create(content=f'post {i}', author=author)
+                post.liked.add(*profiles)
+                for profile in profiles:
+                    Comment.objects.create(user=profile, post=post, body='comment')
+
+    def test_feed_query_count(self):
+        self.client.force_login(self.users[0])
+        # guards against the feed going back to per-post queries
+        with self.assertNumQueries(8):
+            response = self.client.get(reverse('posts:main-post-view'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['qs']), 9)
@@ -1,7 +1,6 @@
 from django.shortcuts import render, redirect
 from django.urls import reverse_lazy
 from .models import Post, Like
-from profiles.models import Profile
 from .forms import PostModelForm, CommentModelForm
 from django.views.generic import UpdateView, DeleteView
 from django.contrib import messages
@@ -12,18 +11,16 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 
 @login_required
 def post_comment_create_and_list_view(request):
-    qs = Post.objects.all()
-    profile = Profile.objects.get(user=request.user)
+    qs = Post.objects.select_related('author__user').prefetch_related(
+        'liked', 'comment_set__user__user')
+    profile = request.user.profile
 
     # initials
     p_form = PostModelForm()
     c_form = CommentModelForm()
     post_added = False
 
-    profile = Profile.objects.get(user=request.user)
-
     if 'submit_p_form' in request.POST:
-        print(request.POST)
         p_form = PostModelForm(request.POST, request.FILES)
         if p_form.is_valid():
             instance = p_form.save(commit=False)
@@ -58,9 +55,9 @@ def like_unlike_post(request):
     if request.method == 'POST':
         post_id = request.POST.get('post_id')
         post_obj = Post.objects.get(id=post_id)
-        profile = Profile.objects.get(user=user)
+        profile = user.profile
 
-        if profile in post_obj.liked.all():
+        if post_obj.liked.filter(pk=profile.pk).exists():
             post_obj.liked.remove(profile)
         else:
             post_obj.liked.add(profile)
@@ -106,7 +103,7 @@ class PostUpdateView(LoginRequiredMixin, UpdateView):
     success_url = reverse_lazy('posts:main-post-view')
 
     def form_valid(self, form):
-        profile = Profile.objects.get(user=self.request.user)
+        profile = self.request.user.profile
         if form.instance.author == profile:
             return super().form_valid(form)
         else:
@@ -1,15 +1,15 @@
-from .models import Profile, Relationship
+from .models import Relationship
 
 def profile_pic(request):
     if request.user.is_authenticated:
-        profile_obj = Profile.objects.get(user=request.user)
+        profile_obj = request.user.profile
         pic = profile_obj.avatar
         return {'picture':pic}
     return {}
 
 def invatations_received_no(request):
     if request.user.is_authenticated:
-        profile_obj = Profile.objects.get(user=request.user)
+        profile_obj = request.user.profile
         qs_count = Relationship.objects.invatations_received(profile_obj).count()
         return {'invites_num':qs_count}
     return {}
\ No newline at end of file
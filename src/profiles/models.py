@@ -4,34 +4,21 @@ import PIL
 from .utils import get_random_code
 from django.template.defaultfilters import slugify
 from django.shortcuts import reverse
-from django.db.models import Q
+from django.db.models import Count
 # Create your models here.
 
 class ProfileManager(models.Manager):
 
     def get_all_profiles_to_invite(self, sender):
-        profiles = Profile.objects.all().exclude(user=sender)
-        profile = Profile.objects.get(user=sender)
-        qs = Relationship.objects.filter(Q(sender=profile) | Q(receiver=profile))
-        print(qs)
-        print("#########")
-
-        accepted = set([])
-        for rel in qs:
-            if rel.status == 'accepted':
-                accepted.add(rel.receiver)
-                accepted.add(rel.sender)
-        print(accepted)
-        print("#########")
-
-        available = [profile for profile in profiles if profile not in accepted]
-        print(available)
-        print("#########")
+        profile = sender.profile
+        # friends can sit on either side of an accepted relationship
+        friends_added = Relationship.objects.filter(sender=profile, status='accepted').values('receiver')
+        friends_accepted = Relationship.objects.filter(receiver=profile, status='accepted').values('sender')
+        available = Profile.objects.exclude(user=sender).exclude(pk__in=friends_added).exclude(pk__in=friends_accepted).select_related('user')
         return available
-        
 
     def get_all_profiles(self, me):
-        profiles = Profile.objects.all().exclude(user=me)
+        profiles = Profile.objects.all().exclude(user=me).select_related('user')
         return profiles
 
 
@@ -81,19 +68,10 @@ class Profile(models.Model):
 		return self.posts.all()
 
 	def get_likes_given_no(self):
-		likes = self.like_set.all()
-		total_liked = 0
-		for item in likes:
-			if item.value=="Like":
-				total_liked+=1
-		return total_liked
+		return self.like_set.filter(value="Like").count()
 
 	def get_likes_recieved_no(self):
-		posts = self.posts.all()
-		total_liked =0
-		for item in posts:
-			total_liked += item.liked.all().count()
-		return total_liked
+		return self.posts.aggregate(total_liked=Count('liked'))['total_liked']
 
 	def get_absolute_url(self):
 		return reverse("profiles:profile-detail-view", kwargs={"slug": self.slug})
@@ -4,25 +4,25 @@ from django.dispatch import receiver
 from .models import Profile,Relationship
 
 @receiver(post_save,sender=User)
-def post_save_createprofile(sender, instance, created, **kwargs):
-	if created:
+def post_save_createprofile(sender, instance, created, raw=False, **kwargs):
+	# fixtures (loaddata) ship their own Profile rows
+	if created and not raw:
 		Profile.objects.create(user=instance)
 
 @receiver(post_save,sender=Relationship)
-def post_save_add_to_friends(sender, instance, created,**kwargs):
-	sender_ = instance.sender
-	receiver_ = instance.receiver
+def post_save_add_to_friends(sender, instance, created, raw=False, **kwargs):
+	if raw:
+		return
+	# only accepted invites touch friends, don't load the profiles otherwise
 	if instance.status == "accepted":
+		sender_ = instance.sender
+		receiver_ = instance.receiver
 		sender_.friends.add(receiver_.user)
 		receiver_.friends.add(sender_.user)
-		sender_.save()
-		receiver_.save()
 
 @receiver(pre_delete, sender=Relationship)
 def pre_delete_remove_from_friends(sender, instance, **kwargs):
     sender = instance.sender
     receiver = instance.receiver
     sender.friends.remove(receiver.user)
-    receiver.friends.remove(sender.user)
-    sender.save()
-    receiver.save()
\ No newline at end of file
+    receiver.friends.remove(sender.user)
\ No newline at end of file
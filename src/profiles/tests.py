@@ -1,3 +1,62 @@
 from django.test import TestCase
+from django.contrib.auth.models import User
+from django.urls import reverse
+from .models import Relationship
 
 # Create your tests here.
+
+class ProfileViewsTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [User.objects.create_user(username=f'user{i}', password='pass123') for i in range(6)]
+        cls.profiles = [user.profile for user in cls.users]
+        me = cls.profiles[0]
+        Relationship.objects.create(sender=me, receiver=cls.profiles[1], status='accepted')
+        Relationship.objects.create(sender=cls.profiles[2], receiver=me, status='accepted')
+        Relationship.objects.create(sender=cls.profiles[3], receiver=me, status='send')
+        Relationship.objects.create(sender=cls.profiles[4], receiver=me, status='send')
+
+    def setUp(self):
+        self.client.force_login(self.users[0])
+
+    def test_profile_list_query_count(self):
+        # guards against the list going back to per-profile queries
+        with self.assertNumQueries(7):
+            response = self.client.get(reverse('profiles:all-profiles-view'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['object_list']), 5)
+
+    def test_accept_invitation(self):
+        sender = self.profiles[3]
+        response = self.client.post(reverse('profiles:accept-invite'), {'profile_pk': sender.pk})
+        self.assertRedirects(response, reverse('profiles:my-invites-view'))
+        rel = Relationship.objects.get(sender=sender, receiver=self.profiles[0])
+        self.assertEqual(rel.status, 'accepted')
+        self.assertTrue(self.profiles[0].friends.filter(pk=sender.user.pk).exists())
+        self.assertTrue(sender.friends.filter(pk=self.users[0].pk).exists())
+
+    def test_reject_invitation(self):
+        sender = self.profiles[4]
+        response = self.client.post(reverse('profiles:reject-invite'), {'profile_pk': sender.pk})
+        self.assertRedirects(response, reverse('profiles:my-invites-view'))
+        self.assertFalse(Relationship.objects.filter(sender=sender, receiver=self.profiles[0]).exists())
+
+    def test_accept_and_reject_unknown_profile(self):
+        unknown_pk = self.profiles[5].pk + 100
+        for name in ('profiles:accept-invite', 'profiles:reject-invite'):
+            with self.subTest(name=name):
+                response = self.client.post(reverse(name), {'profile_pk': unknown_pk})
+                self.assertEqual(response.status_code, 404)
+
+    def test_remove_from_friends(self):
+        # friendships started from either side can be removed
+        for friend in (self.profiles[1], self.profiles[2]):
+            with self.subTest(friend=friend.user.username):
+                response = self.client.post(reverse('profiles:remove-friend'), {'profile_pk': friend.pk},
+                                            HTTP_REFERER=reverse('profiles:all-profiles-view'))
+                self.assertRedirects(response, reverse('profiles:all-profiles-view'))
+                self.assertFalse(Relationship.objects.filter(sender=friend, receiver=self.profiles[0]).exists())
+                self.assertFalse(Relationship.objects.filter(sender=self.profiles[0], receiver=friend).exists())
+                self.assertFalse(self.profiles[0].friends.filter(pk=friend.user.pk).exists())
+                self.assertFalse(friend.friends.filter(pk=self.users[0].pk).exists())
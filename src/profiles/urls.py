@@ -5,7 +5,7 @@ from .views import *
 app_name='profiles'
 
 urlpatterns = [
-	path('myprofile',my_profile_view,name='my_profile_view'),
+	path('myprofile',my_profile_view,name='my-profile-view'),
 	path('', ProfileListView.as_view(), name='all-profiles-view'),
 	path('my-invites/', invites_received_view, name='my-invites-view'),
 	path('to-invite/', invite_profiles_list_view, name='invite-profiles-view'),
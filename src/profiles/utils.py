@@ -1,5 +1,5 @@
-import uuid
+import secrets
 
 def get_random_code():
-	code = str(uuid.uuid4())[:8].replace('-','').lower()
+	code = secrets.token_hex(4)
 	return code
\ No newline at end of file
@@ -2,7 +2,6 @@ from django.shortcuts import render, redirect, get_object_or_404
 from .models import Profile, Relationship
 from .forms import ProfileModelForm
 from django.views.generic import ListView, DetailView
-from django.contrib.auth.models import User
 from django.db.models import Q
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
@@ -10,7 +9,7 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 
 @login_required
 def my_profile_view(request):
-    profile = Profile.objects.get(user=request.user)
+    profile = request.user.profile
     form = ProfileModelForm(request.POST or None, request.FILES or None, instance=profile)
     confirm = False
 
@@ -29,8 +28,8 @@ def my_profile_view(request):
 
 @login_required
 def invites_received_view(request):
-    profile = Profile.objects.get(user=request.user)
-    qs = Relationship.objects.invatations_received(profile)
+    profile = request.user.profile
+    qs = Relationship.objects.invatations_received(profile).select_related('sender__user')
     results = list(map(lambda x: x.sender, qs))
     is_empty = False
     if len(results) == 0:
@@ -47,9 +46,10 @@ def invites_received_view(request):
 def accept_invatation(request):
     if request.method=="POST":
         pk = request.POST.get('profile_pk')
-        sender = Profile.objects.get(pk=pk)
-        receiver = Profile.objects.get(user=request.user)
-        rel = get_object_or_404(Relationship, sender=sender, receiver=receiver)
+        receiver = request.user.profile
+        # the friends signals need the sender's user, fetch it along with the invite
+        qs = Relationship.objects.select_related('sender__user')
+        rel = get_object_or_404(qs, sender__pk=pk, receiver=receiver)
         if rel.status == 'send':
             rel.status = 'accepted'
             rel.save()
@@ -59,9 +59,9 @@ def accept_invatation(request):
 def reject_invatation(request):
     if request.method=="POST":
         pk = request.POST.get('profile_pk')
-        receiver = Profile.objects.get(user=request.user)
-        sender = Profile.objects.get(pk=pk)
-        rel = get_object_or_404(Relationship, sender=sender, receiver=receiver)
+        receiver = request.user.profile
+        qs = Relationship.objects.select_related('sender__user')
+        rel = get_object_or_404(qs, sender__pk=pk, receiver=receiver)
         rel.delete()
     return redirect('profiles:my-invites-view')
 
@@ -94,10 +94,9 @@ class ProfileDetailView(LoginRequiredMixin, DetailView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        user = User.objects.get(username__iexact=self.request.user)
-        profile = Profile.objects.get(user=user)
-        rel_r = Relationship.objects.filter(sender=profile)
-        rel_s = Relationship.objects.filter(receiver=profile)
+        profile = self.request.user.profile
+        rel_r = Relationship.objects.filter(sender=profile).select_related('receiver__user')
+        rel_s = Relationship.objects.filter(receiver=profile).select_related('sender__user')
         rel_receiver = []
         rel_sender = []
         for item in rel_r:
@@ -106,8 +105,9 @@ class ProfileDetailView(LoginRequiredMixin, DetailView):
             rel_sender.append(item.sender.user)
         context["rel_receiver"] = rel_receiver
         context["rel_sender"] = rel_sender
-        context['posts'] = self.get_object().get_all_authors_posts()
-        context['len_posts'] = True if len(self.get_object().get_all_authors_posts()) > 0 else False
+        posts = self.object.get_all_authors_posts()
+        context['posts'] = posts
+        context['len_posts'] = len(posts) > 0
         return context
 
 class ProfileListView(LoginRequiredMixin, ListView):
@@ -116,15 +116,15 @@ class ProfileListView(LoginRequiredMixin, ListView):
     # context_object_name = 'qs'
 
     def get_queryset(self):
-        qs = Profile.objects.get_all_profiles(self.request.user)
+        # the template checks each profile's friends, load them in one go
+        qs = Profile.objects.get_all_profiles(self.request.user).prefetch_related('friends')
         return qs
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        user = User.objects.get(username__iexact=self.request.user)
-        profile = Profile.objects.get(user=user)
-        rel_r = Relationship.objects.filter(sender=profile)
-        rel_s = Relationship.objects.filter(receiver=profile)
+        profile = self.request.user.profile
+        rel_r = Relationship.objects.filter(sender=profile).select_related('receiver__user')
+        rel_s = Relationship.objects.filter(receiver=profile).select_related('sender__user')
         rel_receiver = []
         rel_sender = []
         for item in rel_r:
@@ -134,7 +134,7 @@ class ProfileListView(LoginRequiredMixin, ListView):
         context["rel_receiver"] = rel_receiver
         context["rel_sender"] = rel_sender
         context['is_empty'] = False
-        if len(self.get_queryset()) == 0:
+        if len(self.object_list) == 0:
             context['is_empty'] = True
 
         return context
@@ -144,10 +144,9 @@ def send_invatation(request):
     if request.method=='POST':
         pk = request.POST.get('profile_pk')
         user = request.user
-        sender = Profile.objects.get(user=user)
-        receiver = Profile.objects.get(pk=pk)
+        sender = user.profile
 
-        rel = Relationship.objects.create(sender=sender, receiver=receiver, status='send')
+        rel = Relationship.objects.create(sender=sender, receiver_id=pk, status='send')
 
         return redirect(request.META.get('HTTP_REFERER'))
     return redirect('profiles:my-profile-view')
@@ -157,11 +156,10 @@ def remove_from_friends(request):
     if request.method=='POST':
         pk = request.POST.get('profile_pk')
         user = request.user
-        sender = Profile.objects.get(user=user)
-        receiver = Profile.objects.get(pk=pk)
+        sender = user.profile
 
-        rel = Relationship.objects.get(
-            (Q(sender=sender) & Q(receiver=receiver)) | (Q(sender=receiver) & Q(receiver=sender))
+        rel = Relationship.objects.select_related('sender__user', 'receiver__user').get(
+            (Q(sender=sender) & Q(receiver__pk=pk)) | (Q(sender__pk=pk) & Q(receiver=sender))
         )
         rel.delete()
         return redirect(request.META.get('HTTP_REFERER'))
@@ -10,7 +10,11 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/3.0/ref/settings/
 """
 
+import atexit
 import os
+import shutil
+import sys
+import tempfile
 
 # Build paths inside the project like this: os.path.join(BASE_DIR, ...)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -27,6 +31,9 @@ DEBUG = True
 
 ALLOWED_HOSTS = []
 
+# True while running `manage.py test`, used to switch on test-only settings
+TESTING = len(sys.argv) > 1 and sys.argv[1] == 'test'
+
 
 # Application definition
 
@@ -83,6 +90,20 @@ DATABASES = {
 }
 
 
+# build the test database straight from the models instead of replaying
+# every migration
+class DisableMigrations:
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+if TESTING:
+    MIGRATION_MODULES = DisableMigrations()
+
+
 # Password validation
 # https://docs.djangoproject.com/en/3.0/ref/settings/#auth-password-validators
 
@@ -101,6 +122,12 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# PBKDF2 is deliberately slow; tests only need a hash, not a strong one
+if TESTING:
+    PASSWORD_HASHERS = [
+        'django.contrib.auth.hashers.MD5PasswordHasher',
+    ]
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/3.0/topics/i18n/
@@ -127,6 +154,11 @@ STATIC_ROOT = os.path.join(BASE_DIR,"static")
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR,"media")
 
+# keep files uploaded by tests out of the real media folder
+if TESTING:
+    MEDIA_ROOT = tempfile.mkdtemp(prefix='social_network_media_')
+    atexit.register(shutil.rmtree, MEDIA_ROOT, ignore_errors=True)
+
 STATICFILES_DIRS = [
 os.path.join(BASE_DIR,"static_cdn")
 ]
\ No newline at end of file
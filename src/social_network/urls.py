@@ -22,7 +22,7 @@ from .views import home_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('',home_view, name='home_view'),
+    path('',home_view, name='home-view'),
     path('profiles/', include('profiles.urls',namespace='profiles')),
     path('posts/', include('posts.urls', namespace='posts')),
 ]